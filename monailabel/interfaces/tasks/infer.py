@@ -79,6 +79,7 @@ class InferTask:
         """
         :param path: Model File Path. Supports multiple paths to support versions (Last item will be picked as latest)
         :param network: Model Network (e.g. monai.networks.xyz).  None in case if you use TorchScript (torch.jit).
+            A zero-arg callable is also accepted and invoked lazily to build the network on first use.
         :param type: Type of Infer (segmentation, deepgrow etc..)
         :param dimension: Input dimension
         :param description: Description
@@ -414,7 +415,12 @@ class InferTask:
 
         if network is None:
             if self.network:
-                network = copy.deepcopy(self.network)
+                if callable(self.network) and not isinstance(self.network, torch.nn.Module):
+                    # network factory; building on first use skips the construction
+                    # (and CUDA init) cost for models that are never exercised
+                    network = self.network()
+                else:
+                    network = copy.deepcopy(self.network)
                 network.to(torch.device(device))
 
                 if path:
@@ -68,7 +68,8 @@ class EpistemicScoring(ScoringMethod):
 
     def entropy_3d_volume(self, vol_input):
         # The input is assumed with repetitions, channels and then volumetric data
-        vol_input = vol_input.astype(dtype="float32")
+        if vol_input.dtype != np.float32:
+            vol_input = vol_input.astype(np.float32, copy=False)
         dims = vol_input.shape
         reps = dims[0]
         entropy = np.zeros(dims[2:], dtype="float32")
@@ -9,23 +9,78 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import copy
+import hashlib
 import logging
 import multiprocessing
 import os
+import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 import torch
+from monai.inferers import SimpleInferer
 from monai.metrics.active_learning_metrics import VarianceMetric
+from monai.utils import optional_import
 
 from monailabel.interfaces.datastore import Datastore
 from monailabel.interfaces.tasks.infer import InferTask
 from monailabel.interfaces.tasks.scoring import ScoringMethod
 
+njit, has_numba = optional_import("numba", name="njit")
+prange, _ = optional_import("numba", name="prange")
+
 logger = logging.getLogger(__name__)
 
 
+def _entropy_volume_cpu(vol):
+    # vol is (reps, channels, voxels) float32; threshold, mean over reps and
+    # -p*log(p) over channels run as one fused parallel loop instead of a chain
+    # of full-volume numpy temporaries
+    reps, channels, voxels = vol.shape
+    entropy = np.empty(voxels, dtype=np.float32)
+    for v in prange(voxels):
+        e = 0.0
+        for c in range(channels):
+            s = 0.0
+            for r in range(reps):
+                p = vol[r, c, v]
+                if p <= 0:
+                    p = 0.00005
+                s += p
+            p_avg = s / reps
+            e += -p_avg * np.log(p_avg)
+        entropy[v] = e
+    return entropy
+
+
+if has_numba:
+    try:
+        _entropy_volume_cpu = njit(parallel=True, fastmath=True)(_entropy_volume_cpu)
+        _entropy_volume_cpu(np.full((2, 1, 1), 0.5, dtype=np.float32))  # pay the JIT cost once at import
+    except Exception:
+        has_numba = False
+
+
+def _worker_init(sys_path):
+    # Spawned workers start from a fresh interpreter and do not inherit the sys.path
+    # entries the server appends at startup (the app dir and its lib folder), so
+    # unpickling an app-local infer task would fail with ModuleNotFoundError
+    for p in sys_path:
+        if p not in sys.path:
+            sys.path.append(p)
+
+
+@lru_cache(maxsize=16)
+def _model_ts(model_file, mtime_bucket):
+    # mtime_bucket (minute granularity) expires the cached stat so a newly published
+    # model is still picked up; within the bucket the filesystem is not hit again
+    return int(os.stat(model_file).st_mtime) if model_file and os.path.exists(model_file) else 1
+
+
 class EpistemicScoring(ScoringMethod):
     """
     First version of Epistemic computation used as active learning strategy
@@ -39,6 +94,7 @@ class EpistemicScoring(ScoringMethod):
         use_variance=False,
         key_output_entropy="epistemic_entropy",
         key_output_ts="epistemic_ts",
+        key_output_hash="epistemic_hash",
     ):
         super().__init__(f"Compute initial score based on dropout - {infer_task.description}")
         self.infer_task = infer_task
@@ -49,13 +105,28 @@ class EpistemicScoring(ScoringMethod):
         self.use_variance = use_variance
         self.key_output_entropy = key_output_entropy
         self.key_output_ts = key_output_ts
+        self.key_output_hash = key_output_hash
+
+        self._mem_pool = None
+        self._use_mem_pool = False
 
     def entropy_volume(self, vol_input):
         # The input is assumed with repetitions, channels and then volumetric data
-        vol_input = vol_input.cpu().detach().numpy() if isinstance(vol_input, torch.Tensor) else vol_input
-        vol_input = vol_input.astype(dtype="float32")
+        if isinstance(vol_input, torch.Tensor):
+            if vol_input.is_cuda or not has_numba:
+                return self._entropy_volume_torch(vol_input)
+            # CPU tensors share storage with their numpy view, so the fused numba
+            # loop below runs on the accumulator without a copy
+            vol_input = vol_input.detach().float().numpy()
+        if vol_input.dtype != np.float32:
+            vol_input = vol_input.astype(np.float32, copy=False)
         dims = vol_input.shape
         reps = dims[0]
+
+        if has_numba and len(dims) == (5 if self.dimension == 3 else 4):
+            flat = np.ascontiguousarray(vol_input).reshape(dims[0], dims[1], -1)
+            return _entropy_volume_cpu(flat).reshape(dims[2:])
+
         entropy = np.zeros(dims[2:], dtype="float32")
 
         # Threshold values less than or equal to zero
@@ -84,25 +155,51 @@ class EpistemicScoring(ScoringMethod):
         # Returns a 3D volume of entropy
         return entropy
 
+    def _entropy_volume_torch(self, vol_input):
+        # Fused reduction on the prediction device: mean over repetitions and
+        # -p*log(p) over channels in one pass, no intermediate host buffers.
+        # nan_to_num keeps the old nanmean semantics - a single NaN voxel from an
+        # FP16 forward must not poison the whole score
+        vol = torch.nan_to_num(vol_input.detach().float())
+        vol = torch.where(vol <= 0, torch.full_like(vol, 0.00005), vol)
+
+        if len(vol.shape) == (5 if self.dimension == 3 else 4):
+            t_avg = torch.mean(vol, dim=0)
+            entropy = -torch.sum(t_avg * torch.log(t_avg), dim=0)
+        else:
+            t_avg = torch.mean(torch.squeeze(vol), dim=0)
+            entropy = -t_avg * torch.log(t_avg)
+
+        # Returns a volume of entropy on the same device as the input
+        return entropy
+
     def variance_volume(self, vol_input, ignore_nans=True):
         if ignore_nans:
+            # Run the reduction on the same device as the predictions (single fused kernel
+            # on GPU) instead of round-tripping the full stack through numpy on the host
             vol_input[vol_input <= 0] = 0.0005
-            vari = np.nanvar(vol_input.cpu().detach().numpy(), axis=0)  # torch.var vs np.nanvar (ignore_nans)
-            variance = np.sum(vari, axis=0)
+            vari = torch.nan_to_num(torch.var(vol_input.detach().float(), dim=0, unbiased=False))
+            variance = torch.sum(vari, dim=0)
         else:
             variance_metric = VarianceMetric(threshold=0.0005, spatial_map=True, scalar_reduction="sum")
-            variance = variance_metric(vol_input).cpu().detach().numpy()
+            variance = variance_metric(vol_input).detach()
 
         if self.dimension == 3:
-            variance = np.expand_dims(variance, axis=0)
-            variance = np.expand_dims(variance, axis=0)
+            variance = variance[None, None]
         return variance
 
     def __call__(self, request, datastore: Datastore):
         logger.info("Starting Epistemic Uncertainty scoring")
 
         model_file = self.infer_task.get_path()
-        model_ts = int(os.stat(model_file).st_mtime) if model_file and os.path.exists(model_file) else 1
+        model_ts = _model_ts(model_file, int(time.time() // 60))
+
+        # Second-level cache key: a file touch changes the mtime without changing the
+        # weights; the content hash still matches and the image is not rescored
+        model_hash = None
+        if model_file and os.path.exists(model_file):
+            with open(model_file, "rb") as f:
+                model_hash = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
         self.infer_task.clear_cache()
 
         # Performing Epistemic for all unlabeled images
@@ -118,14 +215,32 @@ class EpistemicScoring(ScoringMethod):
         t_start = time.time()
 
         image_ids = []
-        for image_id in unlabeled_images:
-            image_info = datastore.get_image_info(image_id)
-            prev_ts = image_info.get("epistemic_ts", 0)
-            if prev_ts == model_ts:
-                skipped += 1
-                continue
-            image_ids.append(image_id)
-        image_ids = image_ids[:max_samples] if max_samples else image_ids
+        if max_samples:
+            # Stop scanning as soon as enough candidates are found; no point querying
+            # info for images that would only get sliced away afterwards
+            for image_id in unlabeled_images:
+                image_info = datastore.get_image_info(image_id)
+                if image_info.get("epistemic_ts", 0) == model_ts or (
+                    model_hash and image_info.get(self.key_output_hash) == model_hash
+                ):
+                    skipped += 1
+                    continue
+                image_ids.append(image_id)
+                if len(image_ids) >= max_samples:
+                    break
+        else:
+            # Fetch image info concurrently; the datastore has no bulk query and serial
+            # round-trips dominate scoring startup for large unlabeled pools
+            with ThreadPoolExecutor(None, "ScoreInfo") as e:
+                image_infos = list(e.map(datastore.get_image_info, unlabeled_images))
+
+            for image_id, image_info in zip(unlabeled_images, image_infos):
+                if image_info.get("epistemic_ts", 0) == model_ts or (
+                    model_hash and image_info.get(self.key_output_hash) == model_hash
+                ):
+                    skipped += 1
+                    continue
+                image_ids.append(image_id)
 
         max_workers = request.get("max_workers", 2)
         multi_gpu = request.get("multi_gpu", False)
@@ -133,22 +248,120 @@ class EpistemicScoring(ScoringMethod):
         gpus = (
             list(range(torch.cuda.device_count())) if not multi_gpus or multi_gpus == "all" else multi_gpus.split(",")
         )
+        if multi_gpu and not gpus:
+            logger.info("Distributed/Multi GPU is limited")
+            multi_gpu = False
         device_ids = [f"cuda:{id}" for id in gpus] if multi_gpu else [request.get("device", "cuda")]
 
         max_workers = max_workers if max_workers else max(1, multiprocessing.cpu_count() // 2)
         max_workers = min(max_workers, multiprocessing.cpu_count())
 
-        if len(image_ids) > 1 and (max_workers == 0 or max_workers > 1):
-            logger.info(f"MultiGpu: {multi_gpu}; Using Device(s): {device_ids}; Max Workers: {max_workers}")
-            futures = []
-            with ThreadPoolExecutor(max_workers if max_workers else None, "ScoreInfer") as e:
-                for image_id in image_ids:
-                    futures.append(e.submit(self.run_scoring, image_id, simulation_size, model_ts, datastore))
-                for future in futures:
-                    future.result()
+        use_processes = request.get("use_processes", False)
+        if use_processes:
+            self._mem_pool = None  # not picklable; workers create their own
+        image_uris = {image_id: datastore.get_image_uri(image_id) for image_id in image_ids}
+
+        # Simulation tuning keys from the scoring request; they override the infer
+        # task config once merged into the pre-processed data dict
+        tuning = {k: request[k] for k in ("amp", "cuda_graphs", "simulation_batch_size") if k in request}
+
+        single_gpu = len(device_ids) == 1 and device_ids[0].startswith("cuda") and torch.cuda.is_available()
+        if len(image_ids) > 1 and (max_workers == 0 or max_workers > 1) and single_gpu and not use_processes:
+            # Single GPU: a wider worker pool only adds GIL contention for the
+            # GPU-bound stages.  Double-buffer instead - pre-process image i+1 on a
+            # side thread while image i runs its simulations on the device.  CPU-only
+            # hosts keep the thread pool below; there inference itself releases no GIL
+            # advantage to contend over and the pool still overlaps the transforms.
+            device = device_ids[0]
+            logger.info(f"Single GPU: {device}; Using prefetch pipeline")
+            self._use_mem_pool = True  # one scoring thread, one device
+            with ThreadPoolExecutor(1, "ScorePrefetch") as e:
+                prefetch = e.submit(self._preprocess, image_uris[image_ids[0]], device, tuning)
+                for i, image_id in enumerate(image_ids):
+                    try:
+                        preprocessed = prefetch.result()
+                    except Exception:
+                        logger.exception(f"EPISTEMIC:: {image_id} => pre-processing failed")
+                        preprocessed = None
+                    if i + 1 < len(image_ids):
+                        prefetch = e.submit(self._preprocess, image_uris[image_ids[i + 1]], device, tuning)
+                    if preprocessed is None:
+                        continue
+
+                    # One bad image must not abort the run; the remaining scores still land
+                    try:
+                        info = self.run_scoring(
+                            image_id,
+                            image_uris[image_id],
+                            simulation_size,
+                            model_ts,
+                            device,
+                            preprocessed,
+                            model_hash,
+                            tuning,
+                        )
+                        datastore.update_image_info(image_id, info)
+                    except Exception:
+                        logger.exception(f"EPISTEMIC:: {image_id} => scoring failed")
+        elif len(image_ids) > 1 and (max_workers == 0 or max_workers > 1):
+            logger.info(
+                f"MultiGpu: {multi_gpu}; Using Device(s): {device_ids}; "
+                f"Max Workers: {max_workers}; Processes: {use_processes}"
+            )
+
+            # The shared MemPool is experimental: concurrent enter/exit from several
+            # threads is unspecified and it only routes allocations for the current
+            # device, so it stays off in the worker-pool path
+            self._use_mem_pool = False
+
+            # Pre/post transforms are python/numpy heavy and serialize on the GIL under
+            # threads; worker processes (spawn - isolated CUDA contexts) run them truly
+            # in parallel.  Workers never touch the datastore; updates happen here.
+            if use_processes:
+                e = ProcessPoolExecutor(
+                    max_workers if max_workers else None,
+                    multiprocessing.get_context("spawn"),
+                    initializer=_worker_init,
+                    initargs=(list(sys.path),),
+                )
+            else:
+                e = ThreadPoolExecutor(max_workers if max_workers else None, "ScoreInfer")
+
+            with e:
+                futures = {}
+                for i, image_id in enumerate(image_ids):
+                    # Round-robin images over the devices; each task sticks to one device
+                    device = device_ids[i % len(device_ids)]
+                    futures[image_id] = e.submit(
+                        self.run_scoring,
+                        image_id,
+                        image_uris[image_id],
+                        simulation_size,
+                        model_ts,
+                        device,
+                        model_hash=model_hash,
+                        tuning=tuning,
+                    )
+                for image_id, future in futures.items():
+                    # Persist every completed score even when another image fails
+                    try:
+                        datastore.update_image_info(image_id, future.result())
+                    except Exception:
+                        logger.exception(f"EPISTEMIC:: {image_id} => scoring failed")
         else:
-            for image_id in image_ids:
-                self.run_scoring(image_id, simulation_size, model_ts, datastore)
+            self._use_mem_pool = len(device_ids) == 1  # sequential, but only useful on one device
+            for i, image_id in enumerate(image_ids):
+                device = device_ids[i % len(device_ids)]
+                info = self.run_scoring(
+                    image_id,
+                    image_uris[image_id],
+                    simulation_size,
+                    model_ts,
+                    device,
+                    model_hash=model_hash,
+                    tuning=tuning,
+                )
+                datastore.update_image_info(image_id, info)
 
         summary = {
             "total": len(unlabeled_images),
@@ -161,44 +374,231 @@ class EpistemicScoring(ScoringMethod):
         self.infer_task.clear_cache()
         return summary
 
-    def run_scoring(self, image_id, simulation_size, model_ts, datastore):
-        start = time.time()
+    def _preprocess(self, image_uri, device=None, tuning=None):
+        """
+        Run the infer task's pre-transform chain once per scoring request.  The result
+        acts as a request-local cache: it is shared by all dropout simulations of the
+        image and discarded when run_scoring returns (nothing goes to cache_transforms).
+        """
         request = {
-            "image": datastore.get_image_uri(image_id),
+            "image": image_uri,
             "logging": "error",
             "cache_transforms": False,
         }
 
-        accum_unl_outputs = []
-        for i in range(simulation_size):
-            data = self.infer_task(request=request)
-            pred = data[self.infer_task.output_label_key] if isinstance(data, dict) else None
-            if pred is not None:
-                logger.debug(f"EPISTEMIC:: {image_id} => {i} => pred: {pred.shape}; sum: {np.sum(pred)}")
-                accum_unl_outputs.append(pred)
-            else:
-                logger.info(f"EPISTEMIC:: {image_id} => {i} => pred: None")
+        # Only InferTask.__call__ consumes the 'logging' key and the direct
+        # run_pre_transforms/run_inferer calls below bypass it; set the level on the
+        # infer logger ourselves so per-batch inferer logs stay out of scoring runs
+        logging.getLogger(InferTask.__module__).setLevel(request["logging"].upper())
 
-        accum = torch.stack(accum_unl_outputs)
-        accum = torch.squeeze(accum)
-        if self.dimension == 3:
-            accum = accum[:, 1:, :, :, :] if len(accum.shape) > 4 else accum
+        data = copy.deepcopy(self.infer_task.config())
+        data.update(request)
+        if tuning:
+            data.update(tuning)
+
+        device = device if device else data.get("device", "cuda")
+        device = "cpu" if device.startswith("cuda") and not torch.cuda.is_available() else device
+        data["device"] = device
+        data["image_path"] = request["image"]
+
+        # Dropout keeps every simulation stochastic, so the same pre-processed volume
+        # can be tiled to the batch dimension and run through a single forward pass
+        data = self.infer_task.run_pre_transforms(data, self.infer_task.pre_transforms(data))
+
+        inputs = data[self.infer_task.input_key]
+        inputs = inputs if torch.is_tensor(inputs) else torch.from_numpy(inputs)
+
+        # Upload the volume once per request; the tiled simulation batches are built on
+        # the device and run_inferer's .to(device) becomes a no-op, rather than paying
+        # one full host->device copy per sub-batch
+        if device.startswith("cuda"):
+            inputs = inputs.to(torch.device(device))
+        return data, inputs, device
+
+    def run_scoring(
+        self,
+        image_id,
+        image_uri,
+        simulation_size,
+        model_ts,
+        device=None,
+        preprocessed=None,
+        model_hash=None,
+        tuning=None,
+    ):
+        start = time.time()
+        data, inputs, device = preprocessed if preprocessed else self._preprocess(image_uri, device, tuning)
+
+        # Dedicated stream per scoring run so concurrent workers overlap copy/compute
+        # on their pinned device instead of serializing on the default stream
+        if device.startswith("cuda"):
+            stream = torch.cuda.Stream(device=torch.device(device))
+            with torch.cuda.stream(stream):
+                entropy = self._run_simulations(image_id, data, inputs, simulation_size, device)
+            stream.synchronize()
         else:
-            accum = accum[:, 1:, :, :] if len(accum.shape) > 3 else accum
+            entropy = self._run_simulations(image_id, data, inputs, simulation_size, device)
 
-        entropy = self.variance_volume(accum) if self.use_variance else self.entropy_volume(accum)
-        entropy = float(np.nanmean(entropy))
+        # Drop the request-local cache so pre-processed tensors don't outlive the request
+        data.pop(self.infer_task.input_key, None)
 
         latency = time.time() - start
         logger.info(
-            "EPISTEMIC:: {} => iters: {}; entropy: {}; latency: {};".format(
-                image_id,
-                simulation_size,
-                round(entropy, 4),
-                round(latency, 3),
-            )
+            "EPISTEMIC:: %s => iters: %d; entropy: %s; latency: %s;",
+            image_id,
+            simulation_size,
+            round(entropy, 4),
+            round(latency, 3),
         )
 
-        # Add epistemic_entropy in datastore
+        # Caller adds epistemic_entropy into the datastore
         info = {self.key_output_entropy: entropy, self.key_output_ts: model_ts}
-        datastore.update_image_info(image_id, info)
+        if model_hash:
+            info[self.key_output_hash] = model_hash
+        return info
+
+    def _mem_pool_ctx(self):
+        # Keep the per-image allocations (accumulator, tiled inputs) in one pool that
+        # persists across run_scoring calls; the caching allocator then reuses the same
+        # segments instead of re-issuing cudaMalloc between images.  __call__ gates
+        # this to paths where exactly one thread scores on one device at a time.
+        if hasattr(torch.cuda, "MemPool") and hasattr(torch.cuda.memory, "use_mem_pool"):
+            if self._mem_pool is None:
+                self._mem_pool = torch.cuda.MemPool()
+            return torch.cuda.memory.use_mem_pool(self._mem_pool)
+        return contextlib.nullcontext()
+
+    def _run_simulations(self, image_id, data, inputs, simulation_size, device):
+        # Split simulations into sub-batches for memory limited devices; an explicit
+        # 'simulation_batch_size' in the request/config wins, otherwise derive one
+        # from the free device memory
+        batch_size = int(data.get("simulation_batch_size", 0))
+        if not 0 < batch_size < simulation_size:
+            batch_size = self._default_batch_size(inputs, simulation_size, device)
+
+        # FP16 autocast halves the tensor bytes moved per simulation and enables the
+        # Tensor Core paths; mirrors amp=True used on the training side
+        amp = data.get("amp", True) and device.startswith("cuda")
+
+        use_graphs = (
+            data.get("cuda_graphs", False)
+            and device.startswith("cuda")
+            and hasattr(torch.cuda, "CUDAGraph")
+            and batch_size < simulation_size
+        )
+
+        accum = None
+        with torch.inference_mode():
+            if use_graphs:
+                # Graph capture needs the autocast cast cache disabled - cached FP16
+                # weight casts are freed when the autocast nest unwinds and replays
+                # would reference them.  It also must stay outside the custom MemPool;
+                # capture allocates from its own private pool.
+                with torch.cuda.amp.autocast(enabled=amp, cache_enabled=False):
+                    accum = self._run_simulations_graph(data, inputs, simulation_size, batch_size, device)
+            if accum is None:
+                use_pool = self._use_mem_pool and device.startswith("cuda")
+                pool = self._mem_pool_ctx() if use_pool else contextlib.nullcontext()
+                with pool, torch.cuda.amp.autocast(enabled=amp):
+                    accum = self._run_simulations_eager(image_id, data, inputs, simulation_size, batch_size, device)
+
+            # Reduce within inference_mode (the variance path updates accum in-place)
+            # but outside autocast so the statistics stay in full precision
+            entropy = self.variance_volume(accum) if self.use_variance else self.entropy_volume(accum)
+            return float(entropy.mean().item()) if isinstance(entropy, torch.Tensor) else float(np.nanmean(entropy))
+
+    @staticmethod
+    def _default_batch_size(inputs, simulation_size, device):
+        # Cap the tiled batch so the forward stays within half of the free device
+        # memory; the factor is a rough bound on activation bytes per input byte for
+        # the UNet family.  CPU keeps the full batch - no hard memory ceiling there.
+        if not device.startswith("cuda") or not hasattr(torch.cuda, "mem_get_info"):
+            return simulation_size
+        free, _ = torch.cuda.mem_get_info(torch.device(device))
+        per_simulation = inputs.element_size() * inputs.nelement() * 32
+        return max(1, min(simulation_size, int((free // 2) // max(per_simulation, 1))))
+
+    def _run_simulations_eager(self, image_id, data, inputs, simulation_size, batch_size, device):
+        accum = None
+        filled = 0
+        for i in range(0, simulation_size, batch_size):
+            n = min(batch_size, simulation_size - i)
+            batched = dict(data)
+            batched[self.infer_task.input_key] = inputs[None].repeat(n, *([1] * len(inputs.shape)))
+            batched = self.infer_task.run_inferer(batched, convert_to_batch=False, device=device)
+
+            pred = batched.get(self.infer_task.output_label_key)
+            if pred is None:
+                logger.info("EPISTEMIC:: %s => %d => pred: None", image_id, i)
+                continue
+
+            pred = torch.softmax(pred, dim=1) if pred.shape[1] > 1 else torch.sigmoid(pred)
+            pred = pred[:, 1:] if pred.shape[1] > 1 else pred  # skip background channel
+
+            # Guarded; the sum is a full volume reduction and not worth a kernel otherwise
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("EPISTEMIC:: %s => %d => pred: %s; sum: %s", image_id, i, pred.shape, torch.sum(pred))
+
+            # Write every simulation directly into a single pre-allocated buffer; rows
+            # are packed at 'filled' so skipped sub-batches never leave gaps
+            if accum is None:
+                accum = self._new_accum(simulation_size, pred)
+            accum[filled : filled + n] = pred
+            filled += n
+
+        if accum is None:
+            raise RuntimeError(f"EPISTEMIC:: {image_id} => no simulation produced a prediction")
+        if filled < simulation_size:
+            # Slice off the unwritten tail; torch.empty rows are uninitialized memory
+            # and must not flow into the entropy/variance statistics
+            logger.warning(
+                "EPISTEMIC:: %s => only %d of %d simulations produced predictions", image_id, filled, simulation_size
+            )
+            accum = accum[:filled]
+        return accum
+
+    @staticmethod
+    def _new_accum(simulation_size, pred):
+        # FP16 halves the HBM footprint of the (N, C, ...) stack; the probabilities are
+        # bounded in [0, 1] so the range is sufficient and the reductions upcast to
+        # float32 before computing the statistics
+        dtype = torch.float16 if pred.is_cuda else pred.dtype
+        return torch.empty((simulation_size, *pred.shape[1:]), dtype=dtype, device=pred.device)
+
+    def _run_simulations_graph(self, data, inputs, simulation_size, batch_size, device):
+        # Capture the fixed-shape sub-batch forward once and replay it; replays skip
+        # the per-iteration kernel launch overhead while the graph-safe RNG state
+        # keeps the dropout masks stochastic
+        network = self.infer_task._get_network(device)
+        if network is None or not isinstance(self.infer_task.inferer(data), SimpleInferer):
+            return None  # capture needs a plain forward; fall back to the eager loop
+
+        static_input = inputs[None].repeat(batch_size, *([1] * len(inputs.shape))).to(torch.device(device))
+
+        # Warm up on a side stream before capturing
+        s = torch.cuda.Stream(device=torch.device(device))
+        s.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(s):
+            network(static_input)
+        torch.cuda.current_stream().wait_stream(s)
+
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph):
+            static_output = network(static_input)
+
+        accum = None
+        for i in range(0, simulation_size, batch_size):
+            n = min(batch_size, simulation_size - i)
+            if n == batch_size:
+                graph.replay()
+                pred = static_output
+            else:
+                pred = network(static_input[:n])  # leftover chunk has a different shape
+
+            pred = torch.softmax(pred, dim=1) if pred.shape[1] > 1 else torch.sigmoid(pred)
+            pred = pred[:, 1:] if pred.shape[1] > 1 else pred  # skip background channel
+
+            if accum is None:
+                accum = self._new_accum(simulation_size, pred)
+            accum[i : i + n] = pred
+        return accum
@@ -15,6 +15,7 @@ from typing import Any, Dict, Optional, Union
 
 import lib.infers
 import lib.trainers
+import torch
 from monai.networks.nets import BasicUNet
 
 from monailabel.interfaces.config import TaskConfig
@@ -51,18 +52,40 @@ class Deepgrow2D(TaskConfig):
             url = f"{self.conf.get('pretrained_path', self.PRE_TRAINED_PATH)}/deepgrow_2d_bunet.pt"
             download_file(url, self.path[0])
 
-        # Network
-        self.network = BasicUNet(
+        # Network is built lazily (see the network property); constructing every UNet
+        # up front costs startup latency even for models a session never exercises
+
+    def _build_network(self):
+        network = BasicUNet(
             spatial_dims=2,
             in_channels=3,
             out_channels=1,
             features=(32, 64, 128, 256, 512, 32),
         )
 
+        # TorchScript the network once so every device shares the compiled graph and
+        # the forward pass skips per-op python dispatch
+        if strtobool(self.conf.get("use_torchscript", "false")):
+            try:
+                network = torch.jit.script(network)
+            except Exception as e:
+                logger.warning(f"{self.name}:: TorchScript conversion failed; using eager network ({e})")
+        return network
+
+    @property
+    def network(self):
+        if self._network is None:
+            self._network = self._build_network()
+        return self._network
+
+    @network.setter
+    def network(self, network):
+        self._network = network
+
     def infer(self) -> Union[InferTask, Dict[str, InferTask]]:
         task: InferTask = lib.infers.Deepgrow(
             path=self.path,
-            network=self.network,
+            network=self._build_network,  # fresh instance per device, built on first use
             labels=self.labels,
             preload=strtobool(self.conf.get("preload", "false")),
             config={"cache_transforms": True, "cache_transforms_in_memory": True, "cache_transforms_ttl": 300},
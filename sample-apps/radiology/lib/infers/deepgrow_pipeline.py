@@ -11,7 +11,7 @@
 
 import logging
 import os
-from typing import Callable, Sequence
+from typing import Callable, Dict, Sequence, Tuple
 
 import numpy as np
 import torch
@@ -58,6 +58,7 @@ class InferDeepgrowPipeline(InferTask):
         max_random_points=10,
         random_point_density=1000,
         output_largest_cc=False,
+        compile_network=False,
     ):
         super().__init__(
             path=path,
@@ -77,6 +78,22 @@ class InferDeepgrowPipeline(InferTask):
         self.max_random_points = max_random_points
         self.random_point_density = random_point_density
         self.output_largest_cc = output_largest_cc
+        self.compile_network = compile_network
+        self._compiled: Dict[str, Tuple] = {}
+
+    def _get_network(self, device):
+        network = super()._get_network(device)
+        if network is None or not self.compile_network or not hasattr(torch, "compile"):
+            return network
+
+        # model_size is fixed by the app config, so dynamic=False lets the compiler
+        # specialize the kernels for the exact shape once instead of re-tuning per call.
+        # One entry per device; a republish hands us a fresh network, and overwriting
+        # the entry drops the compiled handle to the replaced one
+        cached = self._compiled.get(device)
+        if cached is None or cached[0] is not network:
+            self._compiled[device] = (network, torch.compile(network, dynamic=False))
+        return self._compiled[device][1]
 
     def pre_transforms(self, data=None) -> Sequence[Callable]:
         t = [
@@ -146,9 +146,10 @@ class MyApp(MONAILabelApp):
         if infers.get("deepgrow_2d") and infers.get("deepgrow_3d"):
             infers["deepgrow_pipeline"] = InferDeepgrowPipeline(
                 path=self.models["deepgrow_2d"].path,
-                network=self.models["deepgrow_2d"].network,
+                network=self.models["deepgrow_2d"]._build_network,  # lazy; built on first use
                 model_3d=infers["deepgrow_3d"],
                 description="Combines Clara Deepgrow 2D and 3D models",
+                compile_network=strtobool(self.conf.get("compile_network", "false")),
             )
 
         #################################################
@@ -0,0 +1,98 @@
+# Copyright (c) MONAI Consortium
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+import torch
+from monai.utils import set_determinism
+
+from monailabel.tasks.scoring.epistemic_v2 import EpistemicScoring, _worker_init
+
+
+class TestEpistemicScoringV2(unittest.TestCase):
+    @staticmethod
+    def new_scoring(dimension=3):
+        infer_task = SimpleNamespace(description="test", dimension=dimension)
+        return EpistemicScoring(infer_task=infer_task)
+
+    @staticmethod
+    def reference_entropy(stack):
+        # Plain numpy reference: threshold, mean over repetitions, -p*log(p) over channels
+        stack = stack.astype(np.float32).copy()
+        stack[stack <= 0] = 0.00005
+        t_avg = np.sum(stack, axis=0) / stack.shape[0]
+        return np.sum(-t_avg * np.log(t_avg), axis=0)
+
+    def setUp(self) -> None:
+        set_determinism(seed=0)
+        self.scoring = self.new_scoring()
+        self.stack = np.random.rand(4, 2, 8, 8, 8).astype(np.float32)
+
+    def tearDown(self) -> None:
+        set_determinism(None)
+
+    def test_entropy_volume_numpy(self):
+        expected = self.reference_entropy(self.stack)
+        result = self.scoring.entropy_volume(self.stack.copy())
+        self.assertEqual(result.shape, expected.shape)
+        self.assertTrue(np.allclose(result, expected, atol=1e-4))
+
+    def test_entropy_volume_torch_matches_numpy(self):
+        expected = self.reference_entropy(self.stack)
+        result = self.scoring._entropy_volume_torch(torch.from_numpy(self.stack.copy()))
+        self.assertEqual(tuple(result.shape), expected.shape)
+        self.assertTrue(np.allclose(result.numpy(), expected, atol=1e-4))
+
+    def test_entropy_volume_cpu_tensor_matches_numpy(self):
+        # CPU tensors route through the fused numba loop when numba is available,
+        # and through the torch reduction otherwise; both must match the numpy path
+        expected = self.reference_entropy(self.stack)
+        result = self.scoring.entropy_volume(torch.from_numpy(self.stack.copy()))
+        result = result.numpy() if isinstance(result, torch.Tensor) else result
+        self.assertEqual(tuple(result.shape), expected.shape)
+        self.assertTrue(np.allclose(result, expected, atol=1e-4))
+
+    def test_entropy_volume_torch_ignores_nan(self):
+        stack = torch.from_numpy(self.stack.copy())
+        stack[0, 0, 0, 0, 0] = float("nan")
+        entropy = self.scoring._entropy_volume_torch(stack)
+        self.assertTrue(bool(torch.isfinite(entropy).all()))
+
+    def test_variance_volume_matches_nanvar(self):
+        stack = self.stack.copy()
+        stack[stack <= 0] = 0.0005
+        expected = np.sum(np.nanvar(stack, axis=0), axis=0)
+
+        result = self.scoring.variance_volume(torch.from_numpy(self.stack.copy()))
+        self.assertEqual(tuple(result.shape), (1, 1, *expected.shape))
+        self.assertTrue(np.allclose(result[0, 0].numpy(), expected, atol=1e-5))
+
+    def test_worker_init_extends_sys_path(self):
+        entry = "/non-existing/app/lib"
+        self.assertNotIn(entry, sys.path)
+        try:
+            _worker_init([entry])
+            self.assertIn(entry, sys.path)
+            _worker_init([entry])  # idempotent; no duplicates on re-init
+            self.assertEqual(sys.path.count(entry), 1)
+        finally:
+            sys.path.remove(entry)
+
+    def test_default_batch_size_cpu(self):
+        inputs = torch.zeros(1, 8, 8, 8)
+        self.assertEqual(EpistemicScoring._default_batch_size(inputs, 5, "cpu"), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()